@@ -0,0 +1,814 @@
+#!/usr/bin/env python3
+"""
+GitHub Models evaluation orchestrator for the awesome-copilot catalog.
+
+Discovers the prompt, instruction and chatmode files in this repository,
+builds an evaluation plan for the GitHub Models API and generates
+evaluation reports so we can compare how well each customization performs
+across models.
+
+Usage:
+  python scripts/github-models-evaluation.py discover
+  python scripts/github-models-evaluation.py plan
+  python scripts/github-models-evaluation.py report
+  python scripts/github-models-evaluation.py summary
+  python scripts/github-models-evaluation.py test-connection
+  python scripts/github-models-evaluation.py evaluate <file>
+  python scripts/github-models-evaluation.py evaluate-all [concurrency]
+
+Requires a GITHUB_TOKEN environment variable (or a .env file) with access
+to GitHub Models for the network commands.
+"""
+
+import asyncio
+import functools
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj, path):
+    """Write obj to path as indented JSON, via orjson when available.
+
+    orjson serializes dict-heavy payloads several times faster than the
+    stdlib encoder and builds the output in a single C-level buffer.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2)
+
+
+def dumps_json(obj):
+    """Serialize one object to an indented JSON string, via orjson when
+    available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+# Report templates parsed once at import; per-item rendering only fills
+# placeholders instead of re-parsing an f-string per iteration.
+_REPORT_SECTION_TPL = """
+### {section} ({count} files)
+
+Evaluated against: {models_list}
+"""
+
+_REPORT_ITEM_TPL = """
+##### {title}
+- **File**: `{filename}`
+- **Description**: {description}
+- **Best Model**: TBD
+- **Overall Score**: TBD/10
+- **Recommendations**: TBD
+"""
+
+# Request body template for evaluation calls; copied shallowly per
+# request with only model/messages swapped in.
+_EVAL_BODY_TPL = {
+    'model': None,
+    'messages': None,
+    'max_tokens': 2000,
+    'temperature': 0.7,
+}
+
+# Shared read-only across all matrix entries; never mutated downstream.
+_TEST_CASES = (
+    'standard_use_case',
+    'edge_case_handling',
+    'output_format_compliance',
+)
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Static orchestrator configuration.
+
+    Frozen with slots so every field read is a cached LOAD_ATTR rather
+    than a dict lookup, and nothing can be rebound at runtime.
+    """
+    directories: dict
+    extensions: dict
+    models: tuple
+    quality_metrics: tuple
+    performance_metrics: tuple
+    metrics: tuple
+    output_dir: str
+    api_base: str
+
+
+# Explicit metric groups; `metrics` is their union and is the order
+# used in evaluation prompts and plan entries.
+_QUALITY_METRICS = (
+    'clarity',
+    'specificity',
+    'effectiveness',
+    'response_quality',
+)
+_PERFORMANCE_METRICS = ('task_completion',)
+
+CONFIG = _Config(
+    directories={
+        'prompts': 'prompts',
+        'instructions': 'instructions',
+        'chatmodes': 'chatmodes',
+    },
+    extensions={
+        'prompts': '.prompt.md',
+        'instructions': '.instructions.md',
+        'chatmodes': '.chatmode.md',
+    },
+    models=(
+        'gpt-4o',
+        'gpt-4o-mini',
+        'Phi-3.5-MoE-instruct',
+        'Meta-Llama-3.1-70B-Instruct',
+    ),
+    quality_metrics=_QUALITY_METRICS,
+    performance_metrics=_PERFORMANCE_METRICS,
+    metrics=_QUALITY_METRICS + _PERFORMANCE_METRICS,
+    output_dir='evaluation-results',
+    api_base='https://models.inference.ai.azure.com',
+)
+
+
+# Matches one KEY=value assignment per .env line; comment and malformed
+# lines simply never match.
+_ENV_RE = re.compile(
+    rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$',
+    re.MULTILINE)
+
+
+def load_env_file():
+    """Load key=value pairs from a .env file into the environment."""
+    try:
+        data = Path('.env').read_bytes()
+    except OSError:
+        return
+    for match in _ENV_RE.finditer(data):
+        key = match.group(1).decode('ascii')
+        value = match.group(2).decode('utf-8')
+        if len(value) >= 2 and value[0] == value[-1] \
+                and value[0] in ('"', "'"):
+            value = value[1:-1]
+        os.environ.setdefault(key, value)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_and_parse(file_path, mtime_ns):
+    """Cached header parse keyed by (path, mtime).
+
+    Repeated lookups share one read of each unchanged file; callers
+    must treat the returned frontmatter dict as read-only.
+    """
+    return _parse_markdown_header(file_path)
+
+
+def _parse_markdown_header(file_path):
+    """Parse the YAML frontmatter and first H1 title from a markdown file.
+
+    Opens the file once and walks it line by line, so the frontmatter and
+    title come out of a single read instead of one pass per field. Returns
+    a (frontmatter, title) tuple; the title falls back to a cleaned-up
+    version of the filename when the file has no H1 heading.
+    """
+    frontmatter = {}
+    title = None
+    try:
+        with open(file_path, 'rb', buffering=65536) as fb:
+            # Peek at the raw prefix: without an opening fence there is
+            # no frontmatter, so the parser can go straight to the body
+            # without running the fence/key-value machinery per line.
+            head = fb.read(4)
+            if head.startswith(b'---\n') or head.startswith(b'---\r'):
+                state = 'fm'
+            else:
+                state = 'pre'
+                fb.seek(0)
+            f = io.TextIOWrapper(fb, encoding='utf-8')
+            for line in f:
+                line = line.rstrip('\r\n')
+                if state == 'pre':
+                    if not line:
+                        continue
+                    if line == '---':
+                        # Opening fence consumed here, so a bare '---'
+                        # in the fm state is always the closing one.
+                        state = 'fm'
+                        continue
+                    state = 'body'
+                if state == 'fm':
+                    if line == '---':
+                        # A frontmatter title makes the body scan
+                        # unnecessary; stop reading here.
+                        if frontmatter.get('title'):
+                            title = frontmatter['title']
+                            break
+                        state = 'body'
+                        continue
+                    key, sep, value = line.partition(':')
+                    if sep and key:
+                        key = key.strip()
+                        value = value.strip()
+                        if len(value) >= 2 and value[0] == value[-1] \
+                                and value[0] in ('"', "'"):
+                            value = value[1:-1]
+                        frontmatter[key] = value
+                elif state == 'body':
+                    if line.startswith('# '):
+                        title = line[2:].strip()
+                        break
+        if title is None:
+            title = os.path.splitext(os.path.basename(file_path))[0]
+            for extension in CONFIG.extensions.values():
+                suffix = extension[:extension.rindex('.')]
+                if title.endswith(suffix):
+                    title = title[:-len(suffix)]
+                    break
+            title = title.replace('-', ' ').title()
+        return frontmatter, title
+    except Exception as e:
+        print(f"Warning: parsing {file_path} failed: {e}")
+        return {}, os.path.splitext(os.path.basename(file_path))[0]
+
+
+class EvaluationOrchestrator:
+    """Drives discovery, planning and evaluation of catalog files."""
+
+    def __init__(self):
+        load_env_file()
+        self.token = os.environ.get('GITHUB_TOKEN')
+        # One wall-clock read per run; every output stamps the same
+        # timestamp instead of re-querying the clock.
+        self.run_timestamp = datetime.now().isoformat()
+        self._targets_cache = None
+        # Built once; every request path reuses the same header dict.
+        self._base_headers = {
+            'Authorization': f'Bearer {self.token}',
+            'Content-Type': 'application/json',
+        }
+        # One pooled session so repeated calls reuse TCP/TLS connections
+        # instead of paying a fresh handshake per request.
+        self._session = None
+        if requests is not None:
+            # POST must be allowed explicitly: urllib3's default
+            # retryable methods exclude it, and every call here is a
+            # POST to /chat/completions.
+            retry = requests.adapters.Retry(
+                total=3, backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=requests.adapters.Retry.DEFAULT_ALLOWED_METHODS
+                | frozenset({'POST'}))
+            self._session = requests.Session()
+            self._session.mount('https://', requests.adapters.HTTPAdapter(
+                pool_connections=16, pool_maxsize=32, max_retries=retry))
+
+    def _collect_catalog_files(self):
+        """Walk the catalog directories and collect matching files.
+
+        Returns {target_type: [(path, st_mtime_ns), ...]} from one
+        scandir pass per unique directory, dispatching entries to their
+        target type by suffix, so co-located types share a walk.
+        """
+        directories = {}
+        for target_type, directory in CONFIG.directories.items():
+            directories.setdefault(directory, []).append(
+                (CONFIG.extensions[target_type], target_type))
+        found = {target_type: [] for target_type in CONFIG.directories}
+        for directory, suffixes in directories.items():
+            if not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    for extension, target_type in suffixes:
+                        if entry.name.endswith(extension):
+                            # scandir already has the stat result; keep
+                            # the mtime so the parse cache needs no
+                            # second stat per file.
+                            found[target_type].append(
+                                (entry.path, entry.stat().st_mtime_ns))
+                            break
+        return found
+
+    def discover_evaluation_targets(self):
+        """Collect evaluation targets, reusing cached results when fresh.
+
+        Results are memoized in memory for repeated calls within one run
+        and persisted next to the other outputs so that back-to-back
+        invocations (plan then report, CI pipelines) skip the re-parse.
+        The cache key is the full list of (path, mtime) pairs from the
+        walk, so adds, removals and in-place edits all invalidate it;
+        only the cheap scandir pass is repeated on a hit.
+        """
+        found = self._collect_catalog_files()
+        key = [[file_path, mtime_ns]
+               for target_type in sorted(found)
+               for file_path, mtime_ns in sorted(found[target_type])]
+        if self._targets_cache is not None and self._targets_cache[0] == key:
+            return self._targets_cache[1]
+        cache_path = Path(CONFIG.output_dir) / 'discovery-cache.json'
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                self._targets_cache = (key, cached['targets'])
+                return cached['targets']
+        except (OSError, ValueError, KeyError):
+            pass
+        targets = self._parse_evaluation_targets(found)
+        self._targets_cache = (key, targets)
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            dump_json({'key': key, 'targets': targets}, cache_path)
+        except OSError:
+            pass
+        return targets
+
+    def _parse_evaluation_targets(self, found):
+        """Parse headers for the collected files and assemble targets."""
+        targets = {target_type: [] for target_type in CONFIG.directories}
+        # Header parsing is I/O-bound and the GIL is released around
+        # read(), so a thread pool overlaps the per-file opens and reads.
+        all_files = [item for files in found.values() for item in files]
+        parsed = {}
+        if all_files:
+            workers = min(32, len(all_files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parsed = dict(zip(
+                    (file_path for file_path, _ in all_files),
+                    pool.map(lambda item: _read_and_parse(*item), all_files)))
+        for target_type, files in found.items():
+            for file_path, _ in sorted(files):
+                frontmatter, title = parsed[file_path]
+                targets[target_type].append({
+                    'file': file_path,
+                    'filename': os.path.basename(file_path),
+                    'title': title,
+                    'description': frontmatter.get('description', ''),
+                    'frontmatter': frontmatter,
+                })
+        return targets
+
+    def test_github_models_connection(self):
+        """Issue a minimal chat completion to verify API access."""
+        if requests is None and httpx is None:
+            print("The 'requests' or 'httpx' package is required "
+                  "for network commands.")
+            return False
+        if not self.token:
+            print("GITHUB_TOKEN is not set; cannot reach GitHub Models.")
+            return False
+        data = {
+            'model': CONFIG.models[0],
+            'messages': [{'role': 'user', 'content': 'Reply with OK.'}],
+            'max_tokens': 10,
+        }
+        try:
+            if self._session is not None:
+                response = self._session.post(
+                    f"{CONFIG.api_base}/chat/completions",
+                    headers=self._base_headers, json=data, timeout=30)
+            else:
+                response = httpx.post(
+                    f"{CONFIG.api_base}/chat/completions",
+                    headers=self._base_headers, json=data, timeout=30)
+            response.raise_for_status()
+            print(f"Connection OK (model: {CONFIG.models[0]})")
+            return True
+        except Exception as e:
+            print(f"Connection failed: {e}")
+            return False
+
+    def run_evaluation(self, model, prompt_text):
+        """Send one evaluation prompt to a model and time the response."""
+        data = dict(_EVAL_BODY_TPL)
+        data['model'] = model
+        data['messages'] = [{'role': 'user', 'content': prompt_text}]
+        start = time.perf_counter()
+        try:
+            response = self._session.post(
+                f"{CONFIG.api_base}/chat/completions",
+                headers=self._base_headers, json=data, timeout=30)
+            elapsed = time.perf_counter() - start
+            response.raise_for_status()
+            body = response.json()
+            return {
+                'model': model,
+                'status': 'completed',
+                'response': body['choices'][0]['message']['content'],
+                'response_time': elapsed,
+            }
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            return {
+                'model': model,
+                'status': 'error',
+                'error': str(e),
+                'response_time': elapsed,
+            }
+
+    async def run_evaluation_async(self, client, semaphore, model, prompt_text):
+        """Async counterpart of run_evaluation sharing one HTTP client."""
+        data = dict(_EVAL_BODY_TPL)
+        data['model'] = model
+        data['messages'] = [{'role': 'user', 'content': prompt_text}]
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.post('/chat/completions', json=data)
+                elapsed = time.perf_counter() - start
+                response.raise_for_status()
+                body = response.json()
+                return {
+                    'model': model,
+                    'status': 'completed',
+                    'response': body['choices'][0]['message']['content'],
+                    'response_time': elapsed,
+                }
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                return {
+                    'model': model,
+                    'status': 'error',
+                    'error': str(e),
+                    'response_time': elapsed,
+                }
+
+    async def _gather_evaluations(self, jobs, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        async with httpx.AsyncClient(
+                base_url=CONFIG.api_base, headers=self._base_headers,
+                timeout=30) as client:
+            return list(await asyncio.gather(
+                *(self.run_evaluation_async(client, semaphore, model, prompt)
+                  for model, prompt in jobs)))
+
+    def run_evaluations(self, jobs, concurrency=8):
+        """Run (model, prompt) jobs, concurrently when httpx is available.
+
+        Requests go out in parallel under an asyncio.Semaphore so wall
+        time approaches total/concurrency round-trips instead of one
+        round-trip per job; without httpx installed the jobs fall back
+        to the serial requests-based path.
+        """
+        if httpx is not None:
+            return asyncio.run(self._gather_evaluations(jobs, concurrency))
+        return [self.run_evaluation(model, prompt) for model, prompt in jobs]
+
+    def _build_evaluation_jobs(self, file_path, models_to_test):
+        """Build the (model, prompt) jobs for one catalog file."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            file_content = f.read()
+        test_prompt = (
+            "You are evaluating a GitHub Copilot customization file. "
+            f"Rate it 1-10 on each of: {', '.join(CONFIG.metrics)}. "
+            "Respond with a JSON object of metric scores and a short "
+            "justification.\n\n---\n\n" + file_content
+        )
+        return [(test_model, test_prompt) for test_model in models_to_test]
+
+    async def evaluate_file_async(self, client, semaphore, file_path,
+                                  models=None):
+        """Evaluate one file with all model calls in flight at once.
+
+        Shares the caller's client and semaphore so several files can
+        be evaluated concurrently under one connection pool and one
+        global concurrency limit.
+        """
+        jobs = self._build_evaluation_jobs(file_path, models or CONFIG.models)
+        model_results = list(await asyncio.gather(
+            *(self.run_evaluation_async(client, semaphore, model, prompt)
+              for model, prompt in jobs)))
+        return {
+            'file': file_path,
+            'evaluated': self.run_timestamp,
+            'results': model_results,
+        }
+
+    def evaluate_file(self, file_path, models=None):
+        """Evaluate a single catalog file against the configured models."""
+        if requests is None and httpx is None:
+            print("The 'requests' or 'httpx' package is required "
+                  "for network commands.")
+            return None
+        if not self.token:
+            print("GITHUB_TOKEN is not set; cannot reach GitHub Models.")
+            return None
+        models_to_test = models or CONFIG.models
+        print(f"  Evaluating with {len(models_to_test)} model(s)...")
+        try:
+            if httpx is not None:
+                async def run():
+                    semaphore = asyncio.Semaphore(8)
+                    async with httpx.AsyncClient(
+                            base_url=CONFIG.api_base,
+                            headers=self._base_headers, timeout=30) as client:
+                        return await self.evaluate_file_async(
+                            client, semaphore, file_path, models_to_test)
+                return asyncio.run(run())
+            jobs = self._build_evaluation_jobs(file_path, models_to_test)
+        except OSError as e:
+            print(f"Warning: reading {file_path} failed: {e}")
+            return None
+        return {
+            'file': file_path,
+            'evaluated': self.run_timestamp,
+            'results': self.run_evaluations(jobs),
+        }
+
+    def evaluate_all(self, concurrency=8):
+        """Evaluate every discovered target against all models.
+
+        All file x model requests share one client and one
+        asyncio.Semaphore, so total wall time approaches
+        total_requests / concurrency round-trips while staying inside
+        the GitHub Models rate limits.
+        """
+        if requests is None and httpx is None:
+            print("The 'requests' or 'httpx' package is required "
+                  "for network commands.")
+            return None
+        if not self.token:
+            print("GITHUB_TOKEN is not set; cannot reach GitHub Models.")
+            return None
+        targets = self.discover_evaluation_targets()
+        files = [item['file']
+                 for items in targets.values() for item in items]
+        print(f"  Evaluating {len(files)} files x "
+              f"{len(CONFIG.models)} models "
+              f"(concurrency {concurrency})...")
+        # A file can vanish or become unreadable between discovery and
+        # evaluation; record an error entry for it instead of letting
+        # one OSError discard the whole batch.
+        if httpx is None:
+            results = []
+            for file_path in files:
+                try:
+                    jobs = self._build_evaluation_jobs(
+                        file_path, CONFIG.models)
+                except OSError as e:
+                    print(f"Warning: reading {file_path} failed: {e}")
+                    results.append(self._file_error_entry(file_path, e))
+                    continue
+                results.append({
+                    'file': file_path,
+                    'evaluated': self.run_timestamp,
+                    'results': self.run_evaluations(jobs),
+                })
+            return results
+
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+            async with httpx.AsyncClient(
+                    base_url=CONFIG.api_base,
+                    headers=self._base_headers, timeout=30) as client:
+                async def one(file_path):
+                    try:
+                        return await self.evaluate_file_async(
+                            client, semaphore, file_path)
+                    except OSError as e:
+                        print(f"Warning: reading {file_path} failed: {e}")
+                        return self._file_error_entry(file_path, e)
+                return list(await asyncio.gather(
+                    *(one(file_path) for file_path in files)))
+        return asyncio.run(run())
+
+    def _file_error_entry(self, file_path, error):
+        """Build the batch result entry for an unreadable file."""
+        return {
+            'file': file_path,
+            'evaluated': self.run_timestamp,
+            'status': 'error',
+            'error': str(error),
+            'results': [],
+        }
+
+    def iter_evaluation_matrix(self, targets):
+        """Yield file x model evaluation matrix entries one at a time."""
+        metrics_template = dict.fromkeys(CONFIG.metrics)
+        models = CONFIG.models
+        for target_type, items in targets.items():
+            for item in items:
+                for model in models:
+                    yield {
+                        'target_type': target_type,
+                        'file': item['file'],
+                        'title': item['title'],
+                        'model': model,
+                        'metrics': dict(metrics_template),
+                        'test_cases': _TEST_CASES,
+                        'status': 'pending',
+                    }
+
+    def write_evaluation_plan(self, targets, output_path):
+        """Stream the evaluation plan to disk entry by entry.
+
+        Serializing matrix entries as they are generated keeps peak
+        memory flat instead of growing with files x models. Returns the
+        number of evaluations planned.
+        """
+        total = sum(len(items) for items in targets.values()) * len(CONFIG.models)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            f.write(f'  "generated": {json.dumps(self.run_timestamp)},\n')
+            f.write(f'  "models": {json.dumps(list(CONFIG.models))},\n')
+            f.write(f'  "metrics": {json.dumps(list(CONFIG.metrics))},\n')
+            f.write(f'  "total_evaluations": {total},\n')
+            f.write('  "evaluation_matrix": [')
+            prefix = '\n    '
+            for entry in self.iter_evaluation_matrix(targets):
+                f.write(prefix + dumps_json(entry).replace('\n', '\n    '))
+                prefix = ',\n    '
+            f.write('\n  ]\n}\n')
+        return total
+
+    def _render_section(self, parts, section, items, models_list):
+        """Append one report section (heading plus item blocks) to parts."""
+        parts.append(_REPORT_SECTION_TPL.format(
+            section=section, count=len(items), models_list=models_list))
+        parts.append(''.join(
+            _REPORT_ITEM_TPL.format_map(
+                {**item,
+                 'description': item['description'] or 'No description'})
+            for item in items))
+
+    def create_evaluation_report(self, targets):
+        """Render the discovery results as a markdown report."""
+        n_prompts, n_instructions, n_chatmodes = map(
+            len, (targets['prompts'], targets['instructions'],
+                  targets['chatmodes']))
+        total = n_prompts + n_instructions + n_chatmodes
+        models_list = ', '.join(CONFIG.models)
+        quality_metrics = ', '.join(CONFIG.quality_metrics)
+        performance_metrics = ', '.join(CONFIG.performance_metrics)
+        parts = []
+        parts.append(f"""# GitHub Models Evaluation Report
+
+Generated: {self.run_timestamp}
+
+## Executive Summary
+
+- **Total files discovered**: {total}
+- **Prompts**: {n_prompts}
+- **Instructions**: {n_instructions}
+- **Chatmodes**: {n_chatmodes}
+- **Models under test**: {models_list}
+- **Quality metrics**: {quality_metrics}
+- **Performance metrics**: {performance_metrics}
+
+## Evaluation Targets
+""")
+        self._render_section(parts, 'Prompts', targets['prompts'], models_list)
+        self._render_section(parts, 'Instructions', targets['instructions'], models_list)
+        self._render_section(parts, 'Chatmodes', targets['chatmodes'], models_list)
+        parts.append(f"""
+## Methodology
+
+Each file is evaluated against {len(CONFIG.models)} models on the
+{quality_metrics} quality metrics
+and {performance_metrics} performance metrics,
+using the GitHub Models inference API.
+""")
+        return ''.join(parts)
+
+
+def _ensure_output_dir():
+    """Create the output directory if needed and return it."""
+    output_dir = Path(CONFIG.output_dir)
+    output_dir.mkdir(exist_ok=True)
+    return output_dir
+
+
+def _cmd_discover(orchestrator, args):
+    targets = orchestrator.discover_evaluation_targets()
+    for target_type, items in targets.items():
+        print(f"{target_type}: {len(items)} files")
+    output_dir = _ensure_output_dir()
+    dump_json(targets, output_dir / 'discovered-targets.json')
+    print(f"Wrote {output_dir / 'discovered-targets.json'}")
+    return 0
+
+
+def _cmd_plan(orchestrator, args):
+    targets = orchestrator.discover_evaluation_targets()
+    plan_path = _ensure_output_dir() / 'evaluation-plan.json'
+    total = orchestrator.write_evaluation_plan(targets, plan_path)
+    print(f"Planned {total} evaluations")
+    print(f"Wrote {plan_path}")
+    return 0
+
+
+def _cmd_report(orchestrator, args):
+    targets = orchestrator.discover_evaluation_targets()
+    report = orchestrator.create_evaluation_report(targets)
+    report_path = _ensure_output_dir() / 'evaluation-report.md'
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(report)
+    print(f"Wrote {report_path}")
+    return 0
+
+
+def _cmd_summary(orchestrator, args):
+    targets = orchestrator.discover_evaluation_targets()
+    lines = ["Evaluation summary", "=================="]
+    for target_type, items in targets.items():
+        lines.append(f"{target_type}: {len(items)} files")
+        for item in items:
+            lines.append(f"  - {item['title']} ({item['filename']})")
+    total = sum(len(items) for items in targets.values())
+    lines.append(f"Total: {total} files x {len(CONFIG.models)} models "
+                 f"= {total * len(CONFIG.models)} evaluations")
+    print('\n'.join(lines))
+    return 0
+
+
+def _cmd_test_connection(orchestrator, args):
+    return 0 if orchestrator.test_github_models_connection() else 1
+
+
+def _cmd_evaluate_all(orchestrator, args):
+    concurrency = 8
+    if args:
+        try:
+            concurrency = int(args[0])
+        except ValueError:
+            concurrency = 0
+        if concurrency < 1:
+            print("Usage: evaluate-all [concurrency]")
+            return 1
+    results = orchestrator.evaluate_all(concurrency)
+    if results is None:
+        return 1
+    output_dir = _ensure_output_dir()
+    dump_json(results, output_dir / 'evaluation-all-results.json')
+    print(f"Wrote {output_dir / 'evaluation-all-results.json'}")
+    return 0
+
+
+def _cmd_evaluate(orchestrator, args):
+    if not args:
+        print("Usage: evaluate <file>")
+        return 1
+    file_path = args[0]
+    results = orchestrator.evaluate_file(file_path)
+    if results is None:
+        return 1
+    output_dir = _ensure_output_dir()
+    out_name = Path(file_path).stem.replace('.', '-') + '-results.json'
+    dump_json(results, output_dir / out_name)
+    print(f"Wrote {output_dir / out_name}")
+    return 0
+
+
+HANDLERS = {
+    'discover': _cmd_discover,
+    'plan': _cmd_plan,
+    'report': _cmd_report,
+    'summary': _cmd_summary,
+    'test-connection': _cmd_test_connection,
+    'evaluate': _cmd_evaluate,
+    'evaluate-all': _cmd_evaluate_all,
+}
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 1
+    command = sys.argv[1]
+    handler = HANDLERS.get(command)
+    if handler is None:
+        print(f"Unknown command: {command}")
+        print(__doc__)
+        return 1
+    return handler(EvaluationOrchestrator(), sys.argv[2:])
+
+
+if __name__ == '__main__':
+    sys.exit(main())